@@ -0,0 +1,71 @@
+"""
+Startup-time check based on `python -X importtime`.
+
+Imports each module in a fresh interpreter and fails if it pulls in one of
+the heavy dependencies at import time or takes longer than the budget.
+
+    python bench_imports.py [--budget-ms 150] [module ...]
+"""
+import os
+import sys
+import argparse
+import subprocess
+
+DEFAULT_MODULES = ["text_fit", "ppt_generator_v2", "ppt_service"]
+HEAVY_MODULES = ["groq", "pptx", "PIL", "requests", "dotenv"]
+DEFAULT_BUDGET_MS = 150
+
+
+def measure_import(module):
+    """Return (cumulative import time in ms, set of top-level packages imported)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        stderr_lines = result.stderr.strip().splitlines()
+        detail = stderr_lines[-1] if stderr_lines else f"exit code {result.returncode}"
+        raise RuntimeError(f"Importing {module} failed:\n{detail}")
+
+    total_us = 0
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        imported.add(name.strip().split(".")[0])
+        if name.strip() == module:
+            total_us = int(cumulative)
+    return total_us / 1000, imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check module import time and lazy dependencies")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        try:
+            elapsed_ms, imported = measure_import(module)
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            failed = True
+            continue
+
+        eager = sorted(set(HEAVY_MODULES) & imported)
+        ok = not eager and elapsed_ms <= args.budget_ms
+        failed = failed or not ok
+        status = "✅" if ok else "❌"
+        print(f"{status} {module}: {elapsed_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+        if eager:
+            print(f"   imported eagerly: {', '.join(eager)}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
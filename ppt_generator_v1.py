@@ -4,18 +4,13 @@ from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
-import requests
-from PIL import Image
-import io
 from dotenv import load_dotenv
 import json
-import time
+from text_fit import fit_font_size
 
 # Load environment variables
 load_dotenv()
 
-print("✅ All imports successful!")
-
 # ===== Layout Configuration =====
 SLIDE_WIDTH = Inches(10)
 SLIDE_HEIGHT = Inches(7.5)
@@ -32,6 +27,10 @@ IMAGE_MAX_HEIGHT = Inches(4.5)
 TEXT_ZONE_RATIO = 0.5 # Percentage of available content width for text
 IMAGE_ZONE_RATIO = 0.5 # Percentage of available content width for image
 
+BODY_FONT_MAX = 18  # Largest bullet size (pt); shrunk to fit long content
+BODY_FONT_MIN = 12  # Smallest bullet size (pt) before we accept overflow
+BODY_LINE_HEIGHT = 1.2  # Calibri's single-line height in ems, before line_spacing
+
 
 class PPTGenerator:
     def __init__(self):
@@ -164,6 +163,8 @@ NO markdown, NO code blocks, JUST the JSON array. Make content substantive and i
             headers = {'Authorization': os.getenv('PEXELS_API_KEY')}
             params = {'query': query, 'per_page': 1, 'orientation': 'landscape'}
 
+            import requests
+
             response = requests.get(url, headers=headers, params=params, timeout=10)
             response.raise_for_status()
 
@@ -182,6 +183,8 @@ NO markdown, NO code blocks, JUST the JSON array. Make content substantive and i
 
         except Exception as e:
             # Create placeholder image
+            from PIL import Image
+
             img = Image.new('RGB', (1200, 800), color='#E3F2FD')
             img.save(save_path)
             return save_path
@@ -241,11 +244,22 @@ NO markdown, NO code blocks, JUST the JSON array. Make content substantive and i
         
         # Parse bullet points
         lines = [line.strip() for line in content.split('\n') if line.strip()]
+        # Remove existing bullet markers
+        lines = [line.lstrip('•-*→►▪').strip() for line in lines]
+        
+        # Shrink the font until every bullet fits the text zone
+        font_size = fit_font_size(
+            lines,
+            text_width,
+            SLIDE_HEIGHT - CONTENT_TOP - MARGIN_BOTTOM,
+            max_size=BODY_FONT_MAX,
+            min_size=BODY_FONT_MIN,
+            space_before=8,
+            space_after=8,
+            line_height=BODY_LINE_HEIGHT
+        )
         
         for i, line in enumerate(lines):
-            # Remove existing bullet markers
-            line = line.lstrip('•-*→►▪').strip()
-            
             if i == 0:
                 p = content_frame.paragraphs[0]
             else:
@@ -253,7 +267,7 @@ NO markdown, NO code blocks, JUST the JSON array. Make content substantive and i
             
             p.text = line
             p.level = 0
-            p.font.size = Pt(18)
+            p.font.size = Pt(font_size)
             p.space_before = Pt(8)
             p.space_after = Pt(8)
             p.line_spacing = 1.2
@@ -1,20 +1,21 @@
 import os
-from groq import Groq
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN
-from pptx.dml.color import RGBColor
-import requests
-from PIL import Image
-import io
-from dotenv import load_dotenv
+import re
 import json
-import time
+import hashlib
+import tempfile
+from text_fit import fit_font_size
 
-# Load environment variables
-load_dotenv()
+# groq, pptx, PIL, requests and dotenv are imported where they are first
+# needed, so e.g. an offline render never loads groq and a deck without
+# images never loads requests.
+
+EMU_PER_INCH = 914400
+
+
+def Inches(inches):
+    """Same as pptx.util.Inches, without importing python-pptx at startup"""
+    return int(inches * EMU_PER_INCH)
 
-print("✅ All imports successful!")
 
 # ===== Layout Configuration =====
 SLIDE_WIDTH = Inches(10)
@@ -31,18 +32,62 @@ GUTTER = Inches(0.4)        # space between text and image
 IMAGE_MAX_HEIGHT = Inches(4.5)
 TEXT_ZONE_RATIO = 0.5 # Percentage of available content width for text
 IMAGE_ZONE_RATIO = 0.5 # Percentage of available content width for image
+PLACEHOLDER_COLOR = '#E3F2FD'
+
+PEXELS_SEARCH_URL = "https://api.pexels.com/v1/search"  # Override with PEXELS_SEARCH_URL env var
+
+BODY_FONT_MAX = 20  # Largest bullet size (pt); shrunk to fit long content
+BODY_FONT_MIN = 12  # Smallest bullet size (pt) before we accept overflow
+BODY_LINE_HEIGHT = 1.2  # Calibri's single-line height in ems, before line_spacing
+BULLET_INDENT = Inches(0.375)  # Hanging indent of level-0 bullets in the default template
+
+# ===== Bundle Configuration =====
+BUNDLE_VERSION = 1
+BUNDLE_OUTLINE_FILE = "outline.json"
+BUNDLE_IMAGE_DIR = "images"
+BUNDLE_BLOB_NAME = re.compile(r"[0-9a-f]{64}\.jpg")  # <sha256>.jpg, nothing else
 
 
 class PPTGenerator:
-    def __init__(self):
-        """Initialize the PPT Generator with Groq API"""
+    def __init__(self, offline=False):
+        """Initialize the PPT Generator with Groq API (skipped when offline)"""
+        from dotenv import load_dotenv
+
+        # Load environment variables
+        load_dotenv()
+
         self.api_key = os.getenv("GROQ_API_KEY")
-        if not self.api_key:
+        self.offline = offline
+        self.on_progress = None  # Optional callback receiving progress event dicts
+        if not offline and not self.api_key:
             raise ValueError("GROQ_API_KEY environment variable is required")
 
-        self.client = Groq(api_key=self.api_key)
         self.text_model = "llama-3.3-70b-versatile"
-        self.presentation = Presentation()
+        self._client = None
+        self._presentation = None
+
+    @property
+    def client(self):
+        """Groq client, created on first use (always None when offline)"""
+        if self._client is None and not self.offline:
+            from groq import Groq
+            self._client = Groq(api_key=self.api_key)
+        return self._client
+
+    @property
+    def presentation(self):
+        """Deck being built, created on first use so fetch-only runs skip pptx"""
+        if self._presentation is None:
+            from pptx import Presentation
+            self._presentation = Presentation()
+        return self._presentation
+
+    def warm_up(self):
+        """Import the heavy dependencies now, e.g. before a worker takes jobs"""
+        from PIL import Image  # noqa: F401
+        import requests  # noqa: F401
+        self.client
+        self.presentation
 
     def generate_content_outline(self, topic, num_slides=5):
         prompt = f"""Create a professional PowerPoint presentation outline about "{topic}" with EXACTLY {num_slides} slides.
@@ -173,12 +218,15 @@ class PPTGenerator:
             }
         ][:num_slides]
 
-    def download_image(self, query, save_path="temp_image.jpg"):
+    def fetch_image_bytes(self, query):
+        """Return the raw bytes of the top Pexels result, or None if unavailable"""
         try:
-            url = "https://api.pexels.com/v1/search"
+            url = os.getenv("PEXELS_SEARCH_URL", PEXELS_SEARCH_URL)
             headers = {'Authorization': os.getenv('PEXELS_API_KEY')}
             params = {'query': query, 'per_page': 1, 'orientation': 'landscape'}
 
+            import requests
+
             response = requests.get(url, headers=headers, params=params, timeout=10)
             response.raise_for_status()
 
@@ -190,16 +238,27 @@ class PPTGenerator:
             img_response = requests.get(image_url, timeout=10)
             img_response.raise_for_status()
 
-            with open(save_path, 'wb') as f:
-                f.write(img_response.content)
-
-            return save_path
+            return img_response.content
 
         except Exception as e:
-            # Create placeholder image
-            img = Image.new('RGB', (1200, 800), color='#E3F2FD')
-            img.save(save_path)
-            return save_path
+            print(f"Could not fetch image for '{query}': {e}")
+            return None
+
+    def download_image(self, query, save_path="temp_image.jpg"):
+        image_bytes = self.fetch_image_bytes(query)
+        if image_bytes is None:
+            return self._create_placeholder_image(save_path)
+
+        with open(save_path, 'wb') as f:
+            f.write(image_bytes)
+        return save_path
+
+    def _create_placeholder_image(self, save_path):
+        from PIL import Image
+
+        img = Image.new('RGB', (1200, 800), color=PLACEHOLDER_COLOR)
+        img.save(save_path)
+        return save_path
 
     def _remove_placeholders(self, slide):
         for shape in list(slide.shapes):
@@ -207,6 +266,9 @@ class PPTGenerator:
                 slide.shapes._spTree.remove(shape._element)
 
     def create_title_slide(self, title, subtitle=""):
+        from pptx.util import Pt
+        from pptx.enum.text import PP_ALIGN
+
         slide_layout = self.presentation.slide_layouts[0]
         slide = self.presentation.slides.add_slide(slide_layout)
 
@@ -224,8 +286,16 @@ class PPTGenerator:
 
         return slide
 
-    def create_content_slide_simple(self, title, content, include_image=False, image_query=None):
-        """Even simpler version - uses PowerPoint's default bullet behavior"""
+    def create_content_slide_simple(self, title, content, include_image=False, image_query=None, image_path=None):
+        """
+        Even simpler version - uses PowerPoint's default bullet behavior.
+
+        If image_path is given it is used as-is (and left on disk) instead of
+        downloading an image for image_query.
+        """
+        from pptx.util import Pt
+        from pptx.dml.color import RGBColor
+
         slide_layout = self.presentation.slide_layouts[1]
         slide = self.presentation.slides.add_slide(slide_layout)
         
@@ -267,11 +337,26 @@ class PPTGenerator:
                 p = text_frame.add_paragraph()
                 p.text = cleaned_lines[i]
         
+        # Shrink the font until every bullet fits the text zone
+        content_height = SLIDE_HEIGHT - CONTENT_TOP - MARGIN_BOTTOM
+        font_size = fit_font_size(
+            cleaned_lines,
+            self._get_text_zone_width(bool(include_image and (image_query or image_path))),
+            content_height,
+            max_size=BODY_FONT_MAX,
+            min_size=BODY_FONT_MIN,
+            space_after=6,
+            indent=BULLET_INDENT,
+            line_height=BODY_LINE_HEIGHT
+        )
+        
         # Format all paragraphs
         for paragraph in text_frame.paragraphs:
             if paragraph.text:  # Only format non-empty paragraphs
-                paragraph.font.size = Pt(20)
+                paragraph.font.size = Pt(font_size)
                 paragraph.font.name = "Calibri"
+                # Override the template's 20% spcBef so spacing matches fit_font_size
+                paragraph.space_before = Pt(0)
                 paragraph.space_after = Pt(6)
                 paragraph.line_spacing = 1.2
                 paragraph.font.color.rgb = RGBColor(51, 51, 51)
@@ -285,10 +370,16 @@ class PPTGenerator:
         # Set position and image (same as before)
         content_shape.left = MARGIN_LEFT
         content_shape.top = CONTENT_TOP
+        content_shape.height = content_height
         
-        if include_image and image_query:
+        if include_image and (image_query or image_path):
+            temp_path = None
             try:
-                image_path = self.download_image(image_query)
+                if image_path is None:
+                    # Unique name so concurrent generators don't clobber each other
+                    fd, temp_path = tempfile.mkstemp(suffix=".jpg")
+                    os.close(fd)
+                    image_path = self.download_image(image_query, temp_path)
                 if image_path and os.path.exists(image_path):
                     usable_width = SLIDE_WIDTH - MARGIN_LEFT - MARGIN_RIGHT
                     text_width = int((usable_width - GUTTER) * TEXT_ZONE_RATIO)
@@ -309,10 +400,11 @@ class PPTGenerator:
                         new_width = int(pic.width * (new_height / pic.height))
                         pic.height = new_height
                         pic.width = new_width
-                    
-                    os.remove(image_path)
             except Exception as e:
                 print(f"Could not add image: {e}")
+            finally:
+                if temp_path and os.path.exists(temp_path):
+                    os.remove(temp_path)
         else:
             content_shape.width = SLIDE_WIDTH - MARGIN_LEFT - MARGIN_RIGHT
         
@@ -331,55 +423,197 @@ class PPTGenerator:
         print(f"Generating {num_slides}-slide presentation on: {topic}")
         
         outline = self.generate_content_outline(topic, num_slides)
+        self._report_progress({"event": "outline", "total": len(outline)})
         
         # Debug: print the outline to see what content we're getting
         print("\nOutline received:")
         for i, slide_data in enumerate(outline):
             print(f"Slide {i+1}: {slide_data.get('title')}")
             print(f"Content: {slide_data.get('content', '')}")
-            print(f"Lines: {len(slide_data.get('content', '').split('\\n'))}")
+            line_count = len(slide_data.get('content', '').split('\\n'))
+            print(f"Lines: {line_count}")
             print("---")
         
+        self._render_outline(outline)
+
+        # output_path may also be a file-like object, e.g. io.BytesIO
+        self.presentation.save(output_path)
+        print(f"\nPresentation saved: {output_path}")
+        return output_path
+
+    def _report_progress(self, event):
+        if self.on_progress:
+            self.on_progress(event)
+
+    def _is_title_slide(self, i, slide_data):
+        # First slide MUST be title slide
+        return i == 0 or slide_data.get("slide_type", "content") == "title"
+
+    def _get_slide_image_query(self, i, slide_data):
+        """Image search term for a slide, or None if the slide has no image"""
+        if self._is_title_slide(i, slide_data):
+            return None
+        image_query = slide_data.get("image_query")
+        # For content slides, add images to alternating slides or when specified
+        if image_query or (i % 2 == 1):
+            return image_query or slide_data.get("title", f"Slide {i+1}")
+        return None
+
+    def _render_outline(self, outline, image_paths=None):
+        """
+        Add a slide per outline entry. image_paths maps slide index to a local
+        image file; slides missing from it download their image instead.
+        Starts a fresh deck so one generator can render many presentations.
+        """
+        self._presentation = None
         for i, slide_data in enumerate(outline):
             title = slide_data.get("title", f"Slide {i+1}")
             content = slide_data.get("content", "")
             slide_type = slide_data.get("slide_type", "content")
             subtitle = slide_data.get("subtitle", "")
-            image_query = slide_data.get("image_query")
 
             print(f"\nCreating slide {i+1}: {title} (Type: {slide_type})")
             print(f"Content preview: {content[:50]}...")
 
-            # First slide MUST be title slide
-            if i == 0 or slide_type == "title":
+            if self._is_title_slide(i, slide_data):
                 self.create_title_slide(title, subtitle)
             else:
-                # For content slides, add images to alternating slides or when specified
-                include_image = bool(image_query) or (i % 2 == 1)
+                image_query = self._get_slide_image_query(i, slide_data)
                 self.create_content_slide_simple(
                     title,
                     content,
-                    include_image=include_image,
-                    image_query=image_query or title
+                    include_image=bool(image_query),
+                    image_query=image_query,
+                    image_path=(image_paths or {}).get(i)
                 )
 
-        self.presentation.save(output_path)
+            self._report_progress({
+                "event": "slide",
+                "index": i + 1,
+                "total": len(outline),
+                "title": title
+            })
+
+    def fetch_to_bundle(self, topic, bundle_dir, num_slides=5):
+        """
+        Network stage: generate the outline and download every slide image
+        into a bundle directory that render_from_bundle can render offline.
+
+        Layout: <bundle_dir>/outline.json plus <bundle_dir>/images/<sha256>.jpg.
+        Each slide that wants an image gets an "image" key naming its blob;
+        slides whose download failed get no key and render with a placeholder.
+        """
+        if self.client is None:
+            raise ValueError("fetch_to_bundle needs a Groq client; create PPTGenerator with offline=False")
+
+        print(f"Fetching {num_slides}-slide bundle on: {topic}")
+        outline = self.generate_content_outline(topic, num_slides)
+
+        image_dir = os.path.join(bundle_dir, BUNDLE_IMAGE_DIR)
+        os.makedirs(image_dir, exist_ok=True)
+
+        for i, slide_data in enumerate(outline):
+            image_query = self._get_slide_image_query(i, slide_data)
+            if not image_query:
+                continue
+
+            image_bytes = self.fetch_image_bytes(image_query)
+            if image_bytes is None:
+                continue
+
+            # Content-addressed so repeated images are stored once
+            blob_name = hashlib.sha256(image_bytes).hexdigest() + ".jpg"
+            blob_path = os.path.join(image_dir, blob_name)
+            if not os.path.exists(blob_path):
+                with open(blob_path, 'wb') as f:
+                    f.write(image_bytes)
+            slide_data["image"] = blob_name
+
+        bundle = {
+            "version": BUNDLE_VERSION,
+            "topic": topic,
+            "slides": outline
+        }
+        with open(os.path.join(bundle_dir, BUNDLE_OUTLINE_FILE), 'w', encoding='utf-8') as f:
+            json.dump(bundle, f, indent=2, ensure_ascii=False)
+
+        print(f"Bundle saved: {bundle_dir}")
+        return bundle_dir
+
+    def render_from_bundle(self, bundle_dir, output_path="presentation.pptx"):
+        """
+        CPU stage: render a bundle written by fetch_to_bundle without any
+        network access. Missing, unreadable or badly named image blobs fall
+        back to a placeholder.
+        """
+        with open(os.path.join(bundle_dir, BUNDLE_OUTLINE_FILE), encoding='utf-8') as f:
+            bundle = json.load(f)
+
+        if bundle.get("version") != BUNDLE_VERSION:
+            raise ValueError(f"Unsupported bundle version: {bundle.get('version')}")
+
+        outline = bundle["slides"]
+        image_dir = os.path.join(bundle_dir, BUNDLE_IMAGE_DIR)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            placeholder_path = None
+            image_paths = {}
+            for i, slide_data in enumerate(outline):
+                if not self._get_slide_image_query(i, slide_data):
+                    continue
+
+                blob_path = self._get_bundle_blob_path(image_dir, slide_data.get("image"))
+                if blob_path:
+                    image_paths[i] = blob_path
+                else:
+                    if placeholder_path is None:
+                        placeholder_path = self._create_placeholder_image(
+                            os.path.join(temp_dir, "placeholder.jpg")
+                        )
+                    image_paths[i] = placeholder_path
+
+            self._render_outline(outline, image_paths)
+            self.presentation.save(output_path)
+
         print(f"\nPresentation saved: {output_path}")
         return output_path
 
-# Initialize the generator
-try:
-    generator = PPTGenerator()
-    print("✅ PPT Generator initialized successfully!")
-except ValueError as e:
-    print(f"❌ Error: {e}")
-    print("Please set your GEMINI_API_KEY first.")
-
-# Generate a presentation
-topic = "Why P.Diddy is a good guy?"  # Change this to your desired topic
-num_slides = 7  # Change this to your desired number of slides
-
-try:
-    output_file = generator.generate_presentation(topic, num_slides, "presentation3.pptx")
-except Exception as e:
-    print(e)
\ No newline at end of file
+    def _get_bundle_blob_path(self, image_dir, blob_name):
+        """Path of a usable image blob, or None so the caller uses a placeholder"""
+        # Only accept bare blob names so a bundle can't point outside images/
+        if not isinstance(blob_name, str) or not BUNDLE_BLOB_NAME.fullmatch(blob_name):
+            return None
+
+        blob_path = os.path.join(image_dir, blob_name)
+        try:
+            from PIL import Image
+
+            with Image.open(blob_path) as img:
+                img.verify()
+        except Exception as e:
+            print(f"Skipping image blob {blob_name}: {e}")
+            return None
+        return blob_path
+
+
+if __name__ == "__main__":
+    # Initialize the generator
+    try:
+        generator = PPTGenerator()
+        print("✅ PPT Generator initialized successfully!")
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        print("Please set your GEMINI_API_KEY first.")
+
+    # Generate a presentation
+    topic = "Why P.Diddy is a good guy?"  # Change this to your desired topic
+    num_slides = 7  # Change this to your desired number of slides
+
+    try:
+        output_file = generator.generate_presentation(topic, num_slides, "presentation3.pptx")
+    except Exception as e:
+        print(e)
+
+    # To split network and rendering work across machines instead:
+    #   PPTGenerator().fetch_to_bundle(topic, "deck_bundle", num_slides)
+    #   PPTGenerator(offline=True).render_from_bundle("deck_bundle", "presentation3.pptx")
\ No newline at end of file
@@ -0,0 +1,353 @@
+import os
+import io
+import re
+import json
+import uuid
+import queue
+import argparse
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from ppt_generator_v2 import PPTGenerator, PLACEHOLDER_COLOR
+
+# ===== Service Configuration =====
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+DEFAULT_WORKERS = 2
+MAX_RETAINED_JOBS = 100  # Finished jobs kept around for /deck and /events lookups
+MAX_SLIDES = 30
+GENERATE_TIMEOUT = 300  # Seconds POST /generate waits before answering 504
+
+PPTX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+
+class Job:
+    """A queued presentation request and the progress events it has produced"""
+
+    def __init__(self, topic, num_slides):
+        self.id = uuid.uuid4().hex
+        self.topic = topic
+        self.num_slides = num_slides
+        self.status = "queued"
+        self.events = []
+        self.deck = None
+        self.error = None
+        self._changed = threading.Condition()
+
+    @property
+    def done(self):
+        return self.status in ("done", "failed")
+
+    def add_event(self, event):
+        with self._changed:
+            self.events.append(event)
+            self._changed.notify_all()
+
+    def start(self):
+        self.status = "running"
+        self.add_event({"event": "started"})
+
+    def finish(self, deck):
+        self.deck = deck
+        self.status = "done"
+        self.add_event({"event": "done", "deck": f"/jobs/{self.id}/deck", "bytes": len(deck)})
+
+    def fail(self, error):
+        self.error = error
+        self.status = "failed"
+        self.add_event({"event": "error", "message": error})
+
+    def wait(self, timeout=None):
+        with self._changed:
+            return self._changed.wait_for(lambda: self.done, timeout)
+
+    def wait_for_events(self, seen, timeout=15):
+        """Block until there are events past index `seen` (or the timeout passes)"""
+        with self._changed:
+            self._changed.wait_for(lambda: len(self.events) > seen or self.done, timeout)
+            return self.events[seen:]
+
+
+class PPTService:
+    """Job queue drained by worker threads that each keep a PPTGenerator warm"""
+
+    def __init__(self, num_workers=DEFAULT_WORKERS):
+        self.jobs = OrderedDict()
+        self.jobs_lock = threading.Lock()
+        self.job_queue = queue.Queue()
+        # Build generators up front so a missing API key fails at startup
+        self.generators = [PPTGenerator() for _ in range(num_workers)]
+        self.workers = []
+
+    def warm_up(self):
+        """Import groq, pptx, PIL and requests once, before the first job arrives"""
+        for generator in self.generators:
+            generator.warm_up()
+
+    def start(self):
+        for generator in self.generators:
+            worker = threading.Thread(target=self._worker_loop, args=(generator,), daemon=True)
+            worker.start()
+            self.workers.append(worker)
+
+    def stop(self):
+        for _ in self.workers:
+            self.job_queue.put(None)
+
+    def submit(self, topic, num_slides):
+        job = Job(topic, num_slides)
+        with self.jobs_lock:
+            self.jobs[job.id] = job
+            self._evict_finished_jobs()
+        self.job_queue.put(job)
+        return job
+
+    def get_job(self, job_id):
+        with self.jobs_lock:
+            return self.jobs.get(job_id)
+
+    def _evict_finished_jobs(self):
+        for job_id in list(self.jobs):
+            if len(self.jobs) <= MAX_RETAINED_JOBS:
+                break
+            if self.jobs[job_id].done:
+                del self.jobs[job_id]
+
+    def _worker_loop(self, generator):
+        while True:
+            job = self.job_queue.get()
+            if job is None:
+                break
+
+            job.start()
+            generator.on_progress = job.add_event
+            try:
+                buffer = io.BytesIO()
+                generator.generate_presentation(job.topic, job.num_slides, buffer)
+                job.finish(buffer.getvalue())
+            except Exception as e:
+                print(f"Job {job.id} failed: {e}")
+                job.fail(str(e))
+            finally:
+                generator.on_progress = None
+
+
+# ===== Stand-in Backends (offline load testing) =====
+def _stub_chat_completion(generator, request_body):
+    """Answer a Groq chat completion with the fallback outline for the prompt's topic"""
+    prompt = request_body["messages"][-1]["content"]
+    topic_match = re.search(r'about "(.*?)" with EXACTLY (\d+) slides', prompt, re.DOTALL)
+    topic = topic_match.group(1) if topic_match else "Load Test"
+    num_slides = int(topic_match.group(2)) if topic_match else 5
+
+    outline = generator._get_fallback_outline(topic, num_slides)
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": 0,
+        "model": request_body.get("model", "stub"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": json.dumps(outline)},
+            "finish_reason": "stop"
+        }],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+    }
+
+
+def _make_stub_image():
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new('RGB', (1200, 800), color=PLACEHOLDER_COLOR).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    """
+    POST /jobs              {"topic": ..., "num_slides": 5} -> {"id": ...}
+    GET  /jobs/<id>         job status
+    GET  /jobs/<id>/events  progress as server-sent events
+    GET  /jobs/<id>/deck    finished .pptx bytes
+    POST /generate          same body as /jobs, blocks and returns .pptx bytes
+                            (504 with the job id if it takes too long)
+    """
+
+    service = None
+    stub_image = None  # Set when stand-in backends are enabled
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        if path == "/jobs":
+            job = self._submit_from_body()
+            if job:
+                self._send_json(202, {"id": job.id, "status": job.status})
+        elif path == "/generate":
+            job = self._submit_from_body()
+            if job:
+                if job.wait(GENERATE_TIMEOUT):
+                    self._send_deck(job)
+                else:
+                    # Job keeps running; the client can poll /jobs/<id>/deck
+                    self._send_json(504, {
+                        "id": job.id,
+                        "status": job.status,
+                        "deck": f"/jobs/{job.id}/deck",
+                        "error": f"Timed out after {GENERATE_TIMEOUT}s"
+                    })
+        elif self.stub_image and path == "/stub/groq/openai/v1/chat/completions":
+            self._send_json(200, _stub_chat_completion(self.service.generators[0], self._read_json()))
+        else:
+            # Consume the body so it isn't read as the next keep-alive request
+            self._discard_body()
+            self._send_json(404, {"error": "Not found"})
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if self.stub_image and path == "/stub/pexels/v1/search":
+            host = self.headers.get("Host")
+            image_url = f"http://{host}/stub/pexels/image.jpg"
+            self._send_json(200, {"photos": [{"src": {"large": image_url}}]})
+            return
+        if self.stub_image and path == "/stub/pexels/image.jpg":
+            self._send_bytes(200, "image/jpeg", self.stub_image)
+            return
+
+        parts = path.strip("/").split("/")
+        if len(parts) < 2 or parts[0] != "jobs":
+            self._send_json(404, {"error": "Not found"})
+            return
+
+        job = self.service.get_job(parts[1])
+        if job is None:
+            self._send_json(404, {"error": "Unknown job"})
+        elif len(parts) == 2:
+            self._send_json(200, {"id": job.id, "status": job.status, "error": job.error})
+        elif parts[2] == "events":
+            self._stream_events(job)
+        elif parts[2] == "deck":
+            self._send_deck(job)
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def _submit_from_body(self):
+        try:
+            body = self._read_json()
+            topic = str(body["topic"]).strip()
+            num_slides = int(body.get("num_slides", 5))
+            if not topic or not 1 <= num_slides <= MAX_SLIDES:
+                raise ValueError(f"topic is required and num_slides must be 1-{MAX_SLIDES}")
+        except (KeyError, TypeError, ValueError) as e:
+            self._send_json(400, {"error": f"Invalid request: {e}"})
+            return None
+        return self.service.submit(topic, num_slides)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _discard_body(self):
+        length = int(self.headers.get("Content-Length", 0))
+        if length:
+            self.rfile.read(length)
+
+    def _send_bytes(self, status, content_type, data):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_json(self, status, payload):
+        self._send_bytes(status, "application/json", json.dumps(payload).encode("utf-8"))
+
+    def _send_deck(self, job):
+        if job.status == "done":
+            self._send_bytes(200, PPTX_CONTENT_TYPE, job.deck)
+        elif job.status == "failed":
+            self._send_json(500, {"error": job.error})
+        else:
+            self._send_json(202, {"id": job.id, "status": job.status})
+
+    def _stream_events(self, job):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        seen = 0
+        try:
+            while True:
+                events = job.wait_for_events(seen)
+                if not events and not job.done:
+                    self.wfile.write(b": keep-alive\n\n")
+                for event in events:
+                    data = json.dumps(event)
+                    self.wfile.write(f"event: {event['event']}\ndata: {data}\n\n".encode("utf-8"))
+                seen += len(events)
+                self.wfile.flush()
+                if job.done and seen == len(job.events):
+                    break
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def enable_stub_backends(host, port):
+    """Point the Groq SDK and Pexels lookups at this server's stand-in endpoints"""
+    base = f"http://{host}:{port}"
+    os.environ["GROQ_BASE_URL"] = f"{base}/stub/groq"
+    os.environ["PEXELS_SEARCH_URL"] = f"{base}/stub/pexels/v1/search"
+    os.environ.setdefault("GROQ_API_KEY", "stub-key")
+    os.environ.setdefault("PEXELS_API_KEY", "stub-key")
+    ServiceHandler.stub_image = _make_stub_image()
+
+
+def create_server(host=DEFAULT_HOST, port=DEFAULT_PORT, num_workers=DEFAULT_WORKERS, stub_backends=False):
+    """Bind the HTTP server and start its workers; the caller runs serve_forever()"""
+    server = ThreadingHTTPServer((host, port), ServiceHandler)
+    if stub_backends:
+        # Use the bound address so port=0 points the stubs at the real port
+        enable_stub_backends(*server.server_address[:2])
+
+    try:
+        service = PPTService(num_workers)
+        service.warm_up()
+    except Exception:
+        server.server_close()
+        raise
+    service.start()
+    ServiceHandler.service = server.service = service
+    return server
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, num_workers=DEFAULT_WORKERS, stub_backends=False):
+    server = create_server(host, port, num_workers, stub_backends)
+    host, port = server.server_address[:2]
+    print(f"PPT service listening on http://{host}:{port} with {num_workers} workers")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.service.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve presentation generation over HTTP")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--stub-backends", action="store_true",
+                        help="Answer Groq and Pexels calls locally (for offline load tests)")
+    args = parser.parse_args()
+    serve(args.host, args.port, args.workers, args.stub_backends)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import io
+import os
+import sys
+import json
+
+import pytest
+
+pytest.importorskip("pptx")
+pytest.importorskip("PIL")
+
+from PIL import Image
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+from ppt_generator_v2 import BUNDLE_IMAGE_DIR, BUNDLE_OUTLINE_FILE, PPTGenerator
+
+TOPIC = "Coral Reefs"
+IMAGE_SIZE = (60, 40)  # Distinct from the 1200x800 placeholder
+PLACEHOLDER_SIZE = (1200, 800)
+
+
+def _jpeg_bytes(size=IMAGE_SIZE):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, color='#336699').save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+def _picture_sizes(deck_path):
+    """Pixel size of the picture on each slide, or None for slides without one"""
+    sizes = []
+    for slide in Presentation(deck_path).slides:
+        pictures = [s for s in slide.shapes if s.shape_type == MSO_SHAPE_TYPE.PICTURE]
+        assert len(pictures) <= 1
+        sizes.append(pictures[0].image.size if pictures else None)
+    return sizes
+
+
+@pytest.fixture
+def bundle_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+
+    generator = PPTGenerator()
+    monkeypatch.setattr(
+        generator, "generate_content_outline",
+        lambda topic, num_slides=5: generator._get_fallback_outline(topic, num_slides)
+    )
+    monkeypatch.setattr(generator, "fetch_image_bytes", lambda query: _jpeg_bytes())
+
+    return generator.fetch_to_bundle(TOPIC, str(tmp_path / "bundle"), num_slides=5)
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    """Make any import of the network clients fail during the render"""
+    monkeypatch.setitem(sys.modules, "requests", None)
+    monkeypatch.setitem(sys.modules, "groq", None)
+
+
+def _render(bundle_dir, tmp_path):
+    output_path = str(tmp_path / "deck.pptx")
+    PPTGenerator(offline=True).render_from_bundle(bundle_dir, output_path)
+    return output_path
+
+
+def _load_outline(bundle_dir):
+    with open(os.path.join(bundle_dir, BUNDLE_OUTLINE_FILE), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _save_outline(bundle_dir, bundle):
+    with open(os.path.join(bundle_dir, BUNDLE_OUTLINE_FILE), 'w', encoding='utf-8') as f:
+        json.dump(bundle, f)
+
+
+def test_fetch_to_bundle_writes_outline_and_deduplicated_blobs(bundle_dir):
+    bundle = _load_outline(bundle_dir)
+    assert bundle["topic"] == TOPIC
+    assert len(bundle["slides"]) == 5
+
+    blob_names = {slide["image"] for slide in bundle["slides"] if "image" in slide}
+    assert len(blob_names) == 1  # Identical images are stored once
+    assert os.listdir(os.path.join(bundle_dir, BUNDLE_IMAGE_DIR)) == list(blob_names)
+
+
+def test_render_from_bundle_works_offline(bundle_dir, tmp_path, offline):
+    deck_path = _render(bundle_dir, tmp_path)
+    assert _picture_sizes(deck_path) == [None, IMAGE_SIZE, IMAGE_SIZE, IMAGE_SIZE, None]
+
+
+def test_missing_corrupt_and_unsafe_blobs_render_placeholders(bundle_dir, tmp_path, offline):
+    # A real image outside images/ that a ../ name would otherwise reach
+    with open(tmp_path / "outside.jpg", 'wb') as f:
+        f.write(_jpeg_bytes())
+    corrupt_name = "0" * 64 + ".jpg"
+    with open(os.path.join(bundle_dir, BUNDLE_IMAGE_DIR, corrupt_name), 'wb') as f:
+        f.write(b"not an image")
+
+    bundle = _load_outline(bundle_dir)
+    bundle["slides"][1]["image"] = "../../outside.jpg"
+    bundle["slides"][2]["image"] = corrupt_name
+    del bundle["slides"][3]["image"]
+    _save_outline(bundle_dir, bundle)
+
+    deck_path = _render(bundle_dir, tmp_path)
+    assert _picture_sizes(deck_path) == [None] + [PLACEHOLDER_SIZE] * 3 + [None]
+
+
+def test_render_from_bundle_rejects_unsupported_version(bundle_dir, tmp_path):
+    bundle = _load_outline(bundle_dir)
+    bundle["version"] = 99
+    _save_outline(bundle_dir, bundle)
+
+    with pytest.raises(ValueError, match="Unsupported bundle version"):
+        _render(bundle_dir, tmp_path)
+
+
+def test_rendering_twice_starts_a_fresh_deck(bundle_dir, tmp_path):
+    generator = PPTGenerator(offline=True)
+    generator.render_from_bundle(bundle_dir, str(tmp_path / "first.pptx"))
+    generator.render_from_bundle(bundle_dir, str(tmp_path / "second.pptx"))
+    assert len(Presentation(str(tmp_path / "second.pptx")).slides) == 5
@@ -0,0 +1,26 @@
+import os
+from functools import lru_cache
+
+import pytest
+
+from bench_imports import DEFAULT_BUDGET_MS, DEFAULT_MODULES, HEAVY_MODULES, measure_import
+
+
+@lru_cache(maxsize=None)
+def _measure(module):
+    return measure_import(module)
+
+
+@pytest.mark.parametrize("module", DEFAULT_MODULES)
+def test_heavy_dependencies_are_not_imported_eagerly(module):
+    _, imported = _measure(module)
+    assert not set(HEAVY_MODULES) & imported
+
+
+# Wall-clock timing depends on the machine, bytecode cache and load, so it
+# only runs when asked for (e.g. on a quiet benchmark box)
+@pytest.mark.skipif(not os.getenv("PPT_BENCH_IMPORTS"), reason="set PPT_BENCH_IMPORTS=1 to run")
+@pytest.mark.parametrize("module", DEFAULT_MODULES)
+def test_import_time_within_budget(module):
+    elapsed_ms, _ = _measure(module)
+    assert elapsed_ms <= DEFAULT_BUDGET_MS
@@ -0,0 +1,114 @@
+import io
+import json
+import threading
+import http.client
+
+import pytest
+
+pytest.importorskip("pptx")
+pytest.importorskip("groq")
+
+from pptx import Presentation
+
+import ppt_service
+from ppt_service import PPTX_CONTENT_TYPE, ServiceHandler, create_server
+
+STUB_ENV = ["GROQ_BASE_URL", "PEXELS_SEARCH_URL", "GROQ_API_KEY", "PEXELS_API_KEY"]
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    with pytest.MonkeyPatch.context() as mp:
+        # enable_stub_backends writes these; the context restores them afterwards
+        for name in STUB_ENV:
+            mp.delenv(name, raising=False)
+        mp.setenv("NO_PROXY", "127.0.0.1,localhost")
+        mp.chdir(tmp_path_factory.mktemp("service"))
+
+        server = create_server("127.0.0.1", 0, num_workers=1, stub_backends=True)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield server
+        finally:
+            server.shutdown()
+            server.server_close()
+            server.service.stop()
+            ServiceHandler.stub_image = None
+            ServiceHandler.service = None
+
+
+def _connect(server):
+    host, port = server.server_address[:2]
+    return http.client.HTTPConnection(host, port, timeout=60)
+
+
+def _post_json(conn, path, payload):
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+    conn.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+    return conn.getresponse()
+
+
+def test_generate_returns_pptx_bytes(server):
+    conn = _connect(server)
+    response = _post_json(conn, "/generate", {"topic": "Solar Power", "num_slides": 4})
+    deck = response.read()
+
+    assert response.status == 200
+    assert response.getheader("Content-Type") == PPTX_CONTENT_TYPE
+    assert len(Presentation(io.BytesIO(deck)).slides) == 4
+
+
+def test_events_stream_outline_slides_and_done_in_order(server):
+    conn = _connect(server)
+    response = _post_json(conn, "/jobs", {"topic": "Wind Power", "num_slides": 3})
+    job_id = json.loads(response.read())["id"]
+    assert response.status == 202
+
+    conn = _connect(server)
+    conn.request("GET", f"/jobs/{job_id}/events")
+    response = conn.getresponse()
+    assert response.getheader("Content-Type") == "text/event-stream"
+
+    events = [
+        json.loads(line[len("data: "):])
+        for line in response.read().decode("utf-8").splitlines()
+        if line.startswith("data: ")
+    ]
+    names = [event["event"] for event in events]
+    assert names == ["started", "outline", "slide", "slide", "slide", "done"]
+    assert [event["index"] for event in events if event["event"] == "slide"] == [1, 2, 3]
+
+    conn = _connect(server)
+    conn.request("GET", events[-1]["deck"])
+    response = conn.getresponse()
+    assert response.status == 200
+    assert len(Presentation(io.BytesIO(response.read())).slides) == 3
+
+
+@pytest.mark.parametrize("payload", [
+    {"num_slides": 3},
+    {"topic": "   "},
+    {"topic": "Tides", "num_slides": 0},
+    {"topic": "Tides", "num_slides": "many"},
+    b"not json",
+])
+def test_bad_request_body_returns_400(server, payload):
+    for path in ("/jobs", "/generate"):
+        conn = _connect(server)
+        response = _post_json(conn, path, payload)
+        assert response.status == 400
+        assert "error" in json.loads(response.read())
+
+
+def test_unknown_post_keeps_the_connection_usable(server):
+    conn = _connect(server)
+    response = _post_json(conn, "/nowhere", {"topic": "x" * 1000})
+    assert response.status == 404
+    response.read()
+
+    # Same keep-alive connection: the 404's body must not leak into this request
+    conn.request("GET", "/jobs/missing")
+    response = conn.getresponse()
+    assert response.status == 404
+    assert json.loads(response.read()) == {"error": "Unknown job"}
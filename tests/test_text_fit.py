@@ -0,0 +1,87 @@
+import time
+
+import pytest
+
+import text_fit
+from text_fit import (
+    EMU_PER_POINT,
+    FRAME_INSET_X,
+    FRAME_INSET_Y,
+    count_lines,
+    fit_font_size,
+    measure_word,
+    wrap_text,
+)
+
+BOX_WIDTH = int(4.3 * 914400)  # Half-width text zone
+BOX_HEIGHT = int(5.5 * 914400)  # CONTENT_TOP to MARGIN_BOTTOM
+SENTENCE = "Modern applications demonstrate practical relevance across many industries today"
+
+
+def _bullets(count, words):
+    text = (SENTENCE + " ") * (words // len(SENTENCE.split()) + 1)
+    return [" ".join(text.split()[:words])] * count
+
+
+@pytest.mark.parametrize("font_size", [10, 14, 20, 32])
+@pytest.mark.parametrize("max_width", [80, 200, 450])
+def test_wrap_text_never_exceeds_max_width(font_size, max_width):
+    text = " ".join(_bullets(1, 30)) + " Supercalifragilisticexpialidocious"
+    for line in wrap_text(text, font_size, max_width):
+        # Rounding in the summed glyph widths can differ in the last digit
+        assert measure_word(line) * font_size <= max_width + 1e-6
+
+
+def test_wrap_text_keeps_every_word():
+    text = " ".join(_bullets(1, 40))
+    assert " ".join(wrap_text(text, 18, 200)).split() == text.split()
+
+
+def test_fit_font_size_never_grows_when_text_is_added():
+    previous = None
+    for words in range(5, 200, 5):
+        size = fit_font_size(_bullets(5, words), BOX_WIDTH, BOX_HEIGHT, max_size=20, min_size=12)
+        if previous is not None:
+            assert size <= previous
+        previous = size
+
+
+def test_fit_font_size_empty_box_uses_max_size():
+    assert fit_font_size([], BOX_WIDTH, BOX_HEIGHT, max_size=20, min_size=12) == 20
+    assert fit_font_size(["", "   "], BOX_WIDTH, BOX_HEIGHT, max_size=20, min_size=12) == 20
+
+
+def test_fit_font_size_zero_width_box_uses_min_size():
+    assert fit_font_size(_bullets(3, 20), 0, BOX_HEIGHT, max_size=20, min_size=12) == 12
+
+
+@pytest.mark.parametrize("count, words", [(3, 25), (5, 15), (5, 20), (4, 10)])
+def test_chosen_size_keeps_modelled_height_inside_box(count, words):
+    bullets = _bullets(count, words)
+    line_height, line_spacing, space_after = 1.2, 1.2, 6
+    size = fit_font_size(
+        bullets, BOX_WIDTH, BOX_HEIGHT, max_size=20, min_size=10,
+        line_spacing=line_spacing, space_after=space_after, line_height=line_height
+    )
+    assert size > 10
+
+    width = BOX_WIDTH / EMU_PER_POINT - FRAME_INSET_X
+    num_lines = sum(count_lines(b, size, width) for b in bullets)
+    height = num_lines * size * line_height * line_spacing + space_after * count
+    assert height <= BOX_HEIGHT / EMU_PER_POINT - FRAME_INSET_Y
+
+
+def test_fit_font_size_handles_a_100_slide_batch_quickly():
+    text_fit.measure_word.cache_clear()
+    slides = [
+        [f"{SENTENCE} number {slide} point {point}" for point in range(5)]
+        for slide in range(100)
+    ]
+
+    start = time.perf_counter()
+    for bullets in slides:
+        fit_font_size(bullets, BOX_WIDTH, BOX_HEIGHT, max_size=20, min_size=12)
+    elapsed = time.perf_counter() - start
+
+    # A few milliseconds in practice; the bound only catches gross regressions
+    assert elapsed < 1.0
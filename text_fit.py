@@ -0,0 +1,153 @@
+from functools import lru_cache
+
+# ===== Text Fit Configuration =====
+EMU_PER_POINT = 12700
+REFERENCE_SIZE = 100  # Glyph widths are measured once at this size and scaled
+FALLBACK_CHAR_WIDTH = 0.5  # Average glyph width (in ems) when no font file loads
+FALLBACK_LINE_HEIGHT = 1.2  # Single-line height (in ems) when no font file loads
+
+# Candidate font files per font name, tried in order
+FONT_FILES = {
+    "Calibri": ["calibri.ttf", "Calibri.ttf", "Carlito-Regular.ttf", "DejaVuSans.ttf", "arial.ttf", "Arial.ttf"],
+}
+
+# Default insets of a python-pptx text frame (0.1" left/right, 0.05" top/bottom)
+FRAME_INSET_X = 7.2 * 2
+FRAME_INSET_Y = 3.6 * 2
+
+
+@lru_cache(maxsize=None)
+def _load_font(font_name):
+    """Load a font at the reference size, or None if no font file is available"""
+    from PIL import ImageFont
+
+    for filename in FONT_FILES.get(font_name, [font_name]):
+        try:
+            return ImageFont.truetype(filename, REFERENCE_SIZE)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size=REFERENCE_SIZE)
+    except (TypeError, OSError):
+        return None
+
+
+class GlyphWidthTable(dict):
+    """Per-font glyph widths in ems, filled in lazily as new characters appear"""
+
+    def __init__(self, font_name):
+        super().__init__()
+        self.font = _load_font(font_name)
+
+    def __missing__(self, char):
+        if self.font is None:
+            width = FALLBACK_CHAR_WIDTH
+        else:
+            width = self.font.getlength(char) / REFERENCE_SIZE
+        self[char] = width
+        return width
+
+
+@lru_cache(maxsize=None)
+def get_glyph_table(font_name="Calibri"):
+    return GlyphWidthTable(font_name)
+
+
+@lru_cache(maxsize=None)
+def get_line_height(font_name="Calibri"):
+    """Natural single-line height of a font in ems (ascent + descent)"""
+    font = _load_font(font_name)
+    if font is None or not hasattr(font, "getmetrics"):
+        return FALLBACK_LINE_HEIGHT
+    ascent, descent = font.getmetrics()
+    return (ascent + descent) / REFERENCE_SIZE
+
+
+@lru_cache(maxsize=4096)
+def measure_word(word, font_name="Calibri"):
+    """Width of a word in ems (multiply by the font size in points for points)"""
+    return sum(map(get_glyph_table(font_name).__getitem__, word))
+
+
+def _split_long_word(word, font_size, max_width, font_name="Calibri"):
+    """Break a word wider than max_width into pieces, like PowerPoint does"""
+    table = get_glyph_table(font_name)
+    pieces = []
+    piece = ""
+    piece_width = 0
+    for char in word:
+        char_width = table[char] * font_size
+        if piece and piece_width + char_width > max_width:
+            pieces.append(piece)
+            piece = ""
+            piece_width = 0
+        piece += char
+        piece_width += char_width
+    pieces.append(piece)
+    return pieces
+
+
+def wrap_text(text, font_size, max_width, font_name="Calibri"):
+    """Greedily wrap text into lines no wider than max_width (in points)"""
+    space = measure_word(" ", font_name) * font_size
+    lines = []
+    current = []
+    current_width = 0
+
+    words = []
+    for word in text.split():
+        if measure_word(word, font_name) * font_size > max_width:
+            words.extend(_split_long_word(word, font_size, max_width, font_name))
+        else:
+            words.append(word)
+
+    for word in words:
+        word_width = measure_word(word, font_name) * font_size
+        if current and current_width + space + word_width > max_width:
+            lines.append(" ".join(current))
+            current = [word]
+            current_width = word_width
+        elif current:
+            current.append(word)
+            current_width += space + word_width
+        else:
+            current = [word]
+            current_width = word_width
+
+    if current:
+        lines.append(" ".join(current))
+    return lines
+
+
+def count_lines(text, font_size, max_width, font_name="Calibri"):
+    return max(1, len(wrap_text(text, font_size, max_width, font_name)))
+
+
+def fit_font_size(paragraphs, box_width, box_height, max_size=20, min_size=10,
+                  font_name="Calibri", line_spacing=1.2, space_before=0,
+                  space_after=6, indent=0, line_height=None):
+    """
+    Pick the largest whole point size at which all paragraphs fit the box.
+
+    box_width, box_height and indent are in EMU (as returned by Inches/Pt);
+    spacing values are in points. line_spacing is a multiple of the font's
+    natural line height (in ems), which defaults to the Pillow font metrics.
+    Falls back to min_size if nothing fits.
+    """
+    width = (int(box_width) - int(indent)) / EMU_PER_POINT - FRAME_INSET_X
+    height = int(box_height) / EMU_PER_POINT - FRAME_INSET_Y
+    paragraphs = [p for p in paragraphs if p.strip()]
+    if not paragraphs:
+        return int(max_size)
+    if width <= 0:
+        return int(min_size)
+
+    if line_height is None:
+        line_height = get_line_height(font_name)
+
+    spacing = (space_before + space_after) * len(paragraphs)
+    for size in range(int(max_size), int(min_size), -1):
+        num_lines = sum(count_lines(p, size, width, font_name) for p in paragraphs)
+        if num_lines * size * line_height * line_spacing + spacing <= height:
+            return size
+    return int(min_size)